@@ -1,142 +1,272 @@
+import asyncio
+import itertools
 import random
 import sys
+from enum import IntEnum
 from typing import Dict
 
-from PySide6.QtCore import Qt, Slot, QPropertyAnimation, QEasingCurve, QTimer
-from PySide6.QtWidgets import (QApplication, QLabel, QPushButton, QVBoxLayout, 
-                               QWidget, QHBoxLayout, QGraphicsDropShadowEffect)
-from PySide6.QtGui import QColor
+import PySide6.QtAsyncio as QtAsyncio
+from PySide6.QtCore import Qt, Property, QPropertyAnimation, QEasingCurve
+from PySide6.QtWidgets import (QApplication, QLabel, QPushButton, QVBoxLayout,
+                               QWidget, QHBoxLayout, QStyle,
+                               QGraphicsOpacityEffect)
+from PySide6.QtGui import QFont
+
+
+# Stylesheets are hoisted to module scope so each QSS string is built once
+# and Qt's style parser sees the same object for every widget instance.
+_ANIMATED_LBL_QSS_TEMPLATE = """
+    QLabel {
+        color: #2d3748;
+        padding: 20px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(255, 255, 255, 0.95), stop:1 rgba(222, 230, 240, 0.85));
+        border-radius: 15px;
+        border: %dpx solid rgba(0, 180, 219, 0.3);
+        border-bottom: 4px solid rgba(45, 55, 72, 0.25);
+        min-height: 80px;
+    }
+"""
+
+# Application-wide stylesheet: QApplication parses this once and matches
+# widgets by type and objectName, so creating a widget no longer costs
+# its own QSS parse and polish pass. Only the animated status label
+# keeps a per-widget stylesheet, because its border width is dynamic.
+_APP_QSS = """
+    QWidget#window {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #74ebd5, stop:0.5 #acb6e5, stop:1 #86a8e7);
+    }
+    QLabel#title {
+        color: white;
+        background: transparent;
+        border: none;
+        padding: 10px;
+    }
+    QLabel#device {
+        color: white;
+        background: rgba(255, 255, 255, 0.2);
+        border-radius: 10px;
+        padding: 8px 15px;
+        border: 1px solid rgba(255, 255, 255, 0.3);
+    }
+    QLabel#stats {
+        color: rgba(255, 255, 255, 0.8);
+        background: transparent;
+        border: none;
+        padding: 5px;
+    }
+    ModernButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #00b4db, stop:1 #0083b0);
+        border: none;
+        border-radius: 25px;
+        color: white;
+        padding: 15px 30px;
+        min-width: 200px;
+    }
+    ModernButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #0083b0, stop:1 #00b4db);
+        transform: translateY(-2px);
+    }
+    ModernButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #006d92, stop:1 #0077a3);
+    }
+    ModernButton#thermo {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ff7e5f, stop:1 #feb47b);
+        min-width: 150px;
+    }
+    ModernButton#thermo:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #feb47b, stop:1 #ff7e5f);
+    }
+    ModernButton#thermo:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #e66b4f, stop:1 #e59b6b);
+    }
+"""
+
+class Kind(IntEnum):
+    """Device kinds; values index the formatter and action tables."""
+    LIGHT = 0
+    THERMO = 1
+    ALARM = 2
+
+
+_FORMATTERS = (
+    lambda value: "On" if value else "Off",
+    lambda value: f"{value}°C",
+    lambda value: "Armed" if value else "Disarmed",
+)
+
+
+def _font(pixel_size: int, bold: bool = False) -> QFont:
+    """Build a UI font; pixel sizes match the old QSS font-size rules"""
+    font = QFont("Segoe UI")
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
 
 
 class ModernButton(QPushButton):
-    """Custom button with modern styling and hover effects"""
-    
-    def __init__(self, text: str, parent=None):
-        super().__init__(text, parent)
-        self.setupStyle()
-    
-    def setupStyle(self):
-        self.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #00b4db, stop:1 #0083b0);
-                border: none;
-                border-radius: 25px;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px 30px;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #0083b0, stop:1 #00b4db);
-                transform: translateY(-2px);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #006d92, stop:1 #0077a3);
-            }
-        """)
+    """Custom button styled by the application stylesheet's ModernButton
+    selector; instances carry no stylesheet of their own."""
 
 
 class AnimatedLabel(QLabel):
     """Custom label with animation capabilities"""
-    
+
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
+        # Stylesheet variants are cached per border width so the pulse
+        # animation never rebuilds a string it has already produced.
+        self._border_width = 2
+        self._qss_by_width = {2: _ANIMATED_LBL_QSS_TEMPLATE % 2}
+        # The label paints its own (alpha-blended) background, so Qt can
+        # skip the system background fill; WA_OpaquePaintEvent stays off
+        # because the rounded corners and rgba colors need compositing.
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self.setupStyle()
         self.setupAnimation()
-    
+
     def setupStyle(self):
-        self.setStyleSheet("""
-            QLabel {
-                color: #2d3748;
-                font-size: 28px;
-                font-weight: bold;
-                padding: 20px;
-                background: rgba(255, 255, 255, 0.9);
-                border-radius: 15px;
-                border: 2px solid rgba(0, 180, 219, 0.3);
-                min-height: 80px;
-            }
-        """)
+        self.setStyleSheet(self._qss_by_width[2])
         self.setAlignment(Qt.AlignCenter)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setXOffset(0)
-        shadow.setYOffset(5)
-        shadow.setColor(QColor(0, 0, 0, 50))
-        self.setGraphicsEffect(shadow)
     
+    def getBorderWidth(self) -> int:
+        return self._border_width
+
+    def setBorderWidth(self, width: int):
+        if width == self._border_width:
+            return
+        self._border_width = width
+        qss = self._qss_by_width.get(width)
+        if qss is None:
+            qss = _ANIMATED_LBL_QSS_TEMPLATE % width
+            self._qss_by_width[width] = qss
+        # Gate updates so the swap triggers one repaint, not one per
+        # style re-polish.
+        self.setUpdatesEnabled(False)
+        self.setStyleSheet(qss)
+        self.setUpdatesEnabled(True)
+
+    borderWidth = Property(int, getBorderWidth, setBorderWidth)
+
     def setupAnimation(self):
-        # Fade animation
-        self.fadeAnimation = QPropertyAnimation(self, b"windowOpacity")
+        # Fade animation: windowOpacity only affects top-level windows
+        # and silently no-ops on a child widget, so animate a per-widget
+        # opacity effect instead. The effect object is created once and
+        # reused for every fade.
+        self._opacity = QGraphicsOpacityEffect(self)
+        self._opacity.setOpacity(1.0)
+        self.setGraphicsEffect(self._opacity)
+        self.fadeAnimation = QPropertyAnimation(self._opacity, b"opacity")
         self.fadeAnimation.setDuration(300)
         self.fadeAnimation.setEasingCurve(QEasingCurve.InOutQuad)
-        
-        # Scale animation would require more complex setup, so we'll use a timer for simple effects
-        self.pulseTimer = QTimer()
-        self.pulseTimer.timeout.connect(self.pulseEffect)
-        
-    def animateTextChange(self, new_text: str):
+
+        # The pulse animation is built lazily on first use: labels whose
+        # text never changes (e.g. the title) skip the QObject entirely.
+        self.pulseAnimation = None
+
+        # One persistent connection; each fade hands its future to the
+        # slot instead of connecting and disconnecting a closure per call.
+        self._fade_future = None
+        self.fadeAnimation.finished.connect(self._onFadeFinished)
+
+    def _onFadeFinished(self):
+        future = self._fade_future
+        if future is not None:
+            self._fade_future = None
+            if not future.done():
+                future.set_result(None)
+
+    def _fadeFinished(self) -> asyncio.Future:
+        """Return a future resolved when the current fade completes"""
+        # A new fade supersedes any in-flight one: cancel the previous
+        # waiter so its coroutine unwinds via CancelledError instead of
+        # pending forever when clicks arrive faster than fades finish.
+        previous = self._fade_future
+        if previous is not None and not previous.done():
+            previous.cancel()
+        self._fade_future = asyncio.get_running_loop().create_future()
+        return self._fade_future
+
+    async def animateTextChange(self, new_text: str, on_text_changed=None):
         """Animate text change with fade effect"""
-        # First fade out
-        self.fadeAnimation.setStartValue(1.0)
-        self.fadeAnimation.setEndValue(0.3)
-        self.fadeAnimation.finished.connect(lambda: self.changeTextAndFadeIn(new_text))
-        self.fadeAnimation.start()
-    
-    def changeTextAndFadeIn(self, new_text: str):
-        """Change text and fade back in"""
-        self.setText(new_text)
-        self.fadeAnimation.finished.disconnect()
-        self.fadeAnimation.setStartValue(0.3)
-        self.fadeAnimation.setEndValue(1.0)
-        self.fadeAnimation.start()
-        
+        try:
+            # First fade out
+            self.fadeAnimation.setStartValue(1.0)
+            self.fadeAnimation.setEndValue(0.3)
+            self.fadeAnimation.start()
+            await self._fadeFinished()
+
+            # Change text and fade back in
+            self.setText(new_text)
+            if on_text_changed is not None:
+                on_text_changed()
+            self.fadeAnimation.setStartValue(0.3)
+            self.fadeAnimation.setEndValue(1.0)
+            self.fadeAnimation.start()
+            await self._fadeFinished()
+        except asyncio.CancelledError:
+            # Superseded by a newer text change; unwind quietly instead
+            # of surfacing the cancellation as a task error.
+            return
+
         # Add pulse effect
-        self.pulseTimer.start(100)
-        QTimer.singleShot(500, self.pulseTimer.stop)
-    
-    def pulseEffect(self):
-        """Simple pulse effect by changing stylesheet"""
-        current_style = self.styleSheet()
-        if "border: 3px solid" in current_style:
-            # Return to normal
-            self.setStyleSheet(current_style.replace("border: 3px solid", "border: 2px solid"))
-        else:
-            # Pulse
-            self.setStyleSheet(current_style.replace("border: 2px solid", "border: 3px solid"))
+        self._startPulse()
+
+    def _startPulse(self):
+        """Start the border pulse, building the animation on first use"""
+        if self.pulseAnimation is None:
+            # Qt interpolates the border width natively instead of a
+            # Python-side timer rewriting the stylesheet.
+            self.pulseAnimation = QPropertyAnimation(self, b"borderWidth")
+            self.pulseAnimation.setDuration(500)
+            # Hold the wide border across the middle half of the run:
+            # int interpolation truncates, so a single midpoint keyframe
+            # would only equal 3 at one instant and never render.
+            self.pulseAnimation.setKeyValueAt(0, 2)
+            self.pulseAnimation.setKeyValueAt(0.25, 3)
+            self.pulseAnimation.setKeyValueAt(0.75, 3)
+            self.pulseAnimation.setKeyValueAt(1, 2)
+        self.pulseAnimation.start()
 
 
 class SmartHomeApp(QWidget):
     """Smart home control application with modern UI and animations"""
-    
+
     def __init__(self):
         super().__init__()
-        self.devices: Dict[str, str] = {
-            "Living Room Light": "Off",
-            "Thermostat": "22°C",
-            "Security System": "Disarmed"
-        }
-        
-        self.current_device = "Living Room Light"
+        # Device state in parallel arrays, all indexed by the rotation
+        # cursor: names and kinds are fixed tuples, states are raw values
+        # (bools for on/off devices, °C as an int for the thermostat)
+        # mutated in place and formatted only when shown.
+        self._device_names = ("Living Room Light", "Thermostat", "Security System")
+        self._device_kinds = (Kind.LIGHT, Kind.THERMO, Kind.ALARM)
+        self._device_states = [False, 22, False]
+        # Per-kind action jump table; slots dispatch through it instead
+        # of comparing device-name strings.
+        self._togglers = (self._toggle_light, self._set_thermo, self._toggle_alarm)
+        # Rotation is a precompiled cycle over the array indices; next()
+        # is O(1) regardless of how many devices are registered.
+        self._device_cycle = itertools.cycle(range(len(self._device_names)))
+        self._device_index = next(self._device_cycle)
+        self.current_device = self._device_names[self._device_index]
+        # Status lines are cached per (device, value); the state space is
+        # tiny, so after a few clicks every status is a dict hit.
+        self._status_cache: Dict[tuple, str] = {}
         self.setupUI()
         self.setupWindow()
     
     def setupWindow(self):
         """Configure main window properties"""
         self.setWindowTitle("🏠 Smart Home Control")
+        self.setObjectName("window")
         self.resize(500, 400)
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #74ebd5, stop:0.5 #acb6e5, stop:1 #86a8e7);
-            }
-        """)
     
     def setupUI(self):
         """Set up the user interface"""
@@ -145,35 +275,26 @@ class SmartHomeApp(QWidget):
         main_layout.setSpacing(30)
         main_layout.setContentsMargins(40, 40, 40, 40)
         
+        # Fonts are set explicitly and shared between widgets, bypassing
+        # the stylesheet font pipeline during polish.
+        title_font = _font(24, bold=True)
+        status_font = _font(28, bold=True)
+        button_font = _font(16, bold=True)
+
         # Title
         title = QLabel("🏠 Smart Home Control")
-        title.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background: transparent;
-                border: none;
-                padding: 10px;
-            }
-        """)
+        title.setObjectName("title")
+        title.setFont(title_font)
         title.setAlignment(Qt.AlignCenter)
-        
+
         # Device status display
-        self.status_label = AnimatedLabel(f"{self.current_device}: {self.devices[self.current_device]}")
-        
+        self.status_label = AnimatedLabel(self._status())
+        self.status_label.setFont(status_font)
+
         # Device indicator
         self.device_label = QLabel(f"Current Device: {self.current_device}")
-        self.device_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 14px;
-                background: rgba(255, 255, 255, 0.2);
-                border-radius: 10px;
-                padding: 8px 15px;
-                border: 1px solid rgba(255, 255, 255, 0.3);
-            }
-        """)
+        self.device_label.setObjectName("device")
+        self.device_label.setFont(_font(14))
         self.device_label.setAlignment(Qt.AlignCenter)
         
         # Buttons layout
@@ -181,47 +302,24 @@ class SmartHomeApp(QWidget):
         
         # Toggle light button
         self.toggle_button = ModernButton("💡 Toggle Light")
-        self.toggle_button.clicked.connect(self.toggleLight)
-        
+        self.toggle_button.setFont(button_font)
+        self.toggle_button.clicked.connect(
+            lambda: asyncio.ensure_future(self.toggleLight()))
+
         # Set thermostat button
         self.thermostat_button = ModernButton("🌡️ Set Thermostat")
-        self.thermostat_button.clicked.connect(self.setThermostat)
-        self.thermostat_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff7e5f, stop:1 #feb47b);
-                border: none;
-                border-radius: 25px;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px 30px;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #feb47b, stop:1 #ff7e5f);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e66b4f, stop:1 #e59b6b);
-            }
-        """)
+        self.thermostat_button.setObjectName("thermo")
+        self.thermostat_button.setFont(button_font)
+        self.thermostat_button.clicked.connect(
+            lambda: asyncio.ensure_future(self.setThermostat()))
         
         button_layout.addWidget(self.toggle_button)
         button_layout.addWidget(self.thermostat_button)
         
         # Statistics
         self.stats_label = QLabel("Actions performed: 0")
-        self.stats_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.8);
-                font-size: 12px;
-                background: transparent;
-                border: none;
-                padding: 5px;
-            }
-        """)
+        self.stats_label.setObjectName("stats")
+        self.stats_label.setFont(_font(12))
         self.stats_label.setAlignment(Qt.AlignCenter)
         self.action_count = 0
         
@@ -234,51 +332,67 @@ class SmartHomeApp(QWidget):
         main_layout.addLayout(button_layout)
         main_layout.addWidget(self.stats_label)
     
-    @Slot()
-    def toggleLight(self):
+    def _status(self) -> str:
+        """Return the current status line, cached per (device, value)"""
+        index = self._device_index
+        value = self._device_states[index]
+        key = (index, value)
+        status = self._status_cache.get(key)
+        if status is None:
+            status = f"{self._device_names[index]}: {_FORMATTERS[self._device_kinds[index]](value)}"
+            self._status_cache[key] = status
+        return status
+
+    def _toggle_light(self):
+        self._device_states[self._device_index] = not self._device_states[self._device_index]
+
+    def _set_thermo(self):
+        current_temp = self._device_states[self._device_index]
+        # Cycle between 20-30°C
+        self._device_states[self._device_index] = 20 if current_temp >= 30 else current_temp + 1
+
+    def _toggle_alarm(self):
+        self._device_states[self._device_index] = not self._device_states[self._device_index]
+
+    async def toggleLight(self):
         """Toggle the light state and update UI"""
         # Cycle to next device
-        device_list = list(self.devices.keys())
-        current_index = device_list.index(self.current_device)
-        self.current_device = device_list[(current_index + 1) % len(device_list)]
-        
+        self._device_index = next(self._device_cycle)
+        self.current_device = self._device_names[self._device_index]
+
         # Toggle light if current device is a light
-        if self.current_device == "Living Room Light":
-            self.devices["Living Room Light"] = "On" if self.devices["Living Room Light"] == "Off" else "Off"
-        
+        kind = self._device_kinds[self._device_index]
+        if kind is Kind.LIGHT:
+            self._togglers[kind]()
+
         self.action_count += 1
-        
-        # Update status label with animation
-        self.status_label.animateTextChange(f"{self.current_device}: {self.devices[self.current_device]}")
-        
-        # Update device and stats labels
-        QTimer.singleShot(150, lambda: self.updateInfoLabels(self.current_device))
-    
-    @Slot()
-    def setThermostat(self):
+
+        # Update status label with animation; the info labels refresh at
+        # the fade's text swap so a single driver repaints everything.
+        await self.status_label.animateTextChange(
+            self._status(), self.updateInfoLabels)
+
+    async def setThermostat(self):
         """Set thermostat temperature and update UI"""
         # Cycle to next device
-        device_list = list(self.devices.keys())
-        current_index = device_list.index(self.current_device)
-        self.current_device = device_list[(current_index + 1) % len(device_list)]
-        
+        self._device_index = next(self._device_cycle)
+        self.current_device = self._device_names[self._device_index]
+
         # Adjust thermostat if current device is thermostat
-        if self.current_device == "Thermostat":
-            current_temp = int(self.devices["Thermostat"].replace("°C", ""))
-            new_temp = (current_temp + 1) % 30 if current_temp < 30 else 20  # Cycle between 20-30°C
-            self.devices["Thermostat"] = f"{new_temp}°C"
-        
+        kind = self._device_kinds[self._device_index]
+        if kind is Kind.THERMO:
+            self._togglers[kind]()
+
         self.action_count += 1
-        
-        # Update status label with animation
-        self.status_label.animateTextChange(f"{self.current_device}: {self.devices[self.current_device]}")
-        
-        # Update device and stats labels
-        QTimer.singleShot(150, lambda: self.updateInfoLabels(self.current_device))
+
+        # Update status label with animation; the info labels refresh at
+        # the fade's text swap so a single driver repaints everything.
+        await self.status_label.animateTextChange(
+            self._status(), self.updateInfoLabels)
     
-    def updateInfoLabels(self, device: str):
+    def updateInfoLabels(self):
         """Update device and statistics labels"""
-        self.device_label.setText(f"Current Device: {device}")
+        self.device_label.setText(f"Current Device: {self.current_device}")
         self.stats_label.setText(f"Actions performed: {self.action_count}")
 
 
@@ -289,19 +403,24 @@ def main():
     # Set application properties
     app.setApplicationName("Smart Home Control")
     app.setOrganizationName("Smart Home Inc.")
-    
+
+    # Parse the stylesheet once, before any widget exists
+    app.setStyleSheet(_APP_QSS)
+
     # Create and show widget
     widget = SmartHomeApp()
     widget.show()
     
-    # Center window on screen
+    # Center window on screen; alignedRect does the math in Qt against
+    # the post-layout size, so DPI-scaled sizes center correctly too.
     screen_geometry = app.primaryScreen().availableGeometry()
-    widget_geometry = widget.geometry()
-    x = (screen_geometry.width() - widget_geometry.width()) // 2
-    y = (screen_geometry.height() - widget_geometry.height()) // 2
-    widget.move(x, y)
-    
-    sys.exit(app.exec())
+    widget.setGeometry(QStyle.alignedRect(
+        Qt.LeftToRight, Qt.AlignCenter, widget.size(), screen_geometry))
+
+    # QtAsyncio.run returns None on this keep_running path, so unlike
+    # sys.exit(app.exec()) there is no exit status to forward; a code
+    # passed to QApplication.exit() is not observable here.
+    QtAsyncio.run(handle_sigint=True)
 
 
 if __name__ == "__main__":